@@ -1,11 +1,68 @@
 from collections.abc import Callable
-from contextlib import asynccontextmanager
-from functools import partial, wraps
+from types import TracebackType
 from typing import Any
 
 import click
 
-from .typedefs import PluginFactory, PluginLifespan
+from .typedefs import PluginFactory, PluginLifespan, PluginTask
+
+
+class _PluginLifespanContext:
+    """Drives a plugin's lifespan generator as an async context manager
+
+    Does what contextlib.asynccontextmanager would, without the wraps and
+    partial layers that cost an allocation and a call frame per plugin entry.
+    """
+
+    __slots__ = ("_agen",)
+
+    def __init__(self, agen: PluginLifespan) -> None:
+        self._agen = agen
+
+    async def __aenter__(self) -> PluginTask | None:
+        try:
+            return await anext(self._agen)
+        except StopAsyncIteration:
+            raise RuntimeError("plugin lifespan did not yield") from None
+
+    async def __aexit__(
+        self,
+        typ: type[BaseException] | None,
+        value: BaseException | None,
+        tb: TracebackType | None,
+    ) -> bool:
+        if typ is None:
+            try:
+                await anext(self._agen)
+            except StopAsyncIteration:
+                return False
+            raise RuntimeError("plugin lifespan yielded more than once")
+
+        if value is None:
+            value = typ()
+
+        try:
+            await self._agen.athrow(value)
+        except StopAsyncIteration as exc:
+            # only suppress if this is the generator finishing, not the
+            # thrown-in StopAsyncIteration having propagated uncaught
+            return exc is not value
+        except RuntimeError as exc:
+            if exc is value:
+                return False
+            # a thrown-in Stop(Async)Iteration propagating uncaught arrives
+            # PEP-479-wrapped; let the original fall out of the with block
+            if (
+                isinstance(value, (StopIteration, StopAsyncIteration))
+                and exc.__cause__ is value
+            ):
+                return False
+            raise
+        except BaseException as exc:
+            if exc is not value:
+                raise
+            return False
+        raise RuntimeError("plugin lifespan yielded instead of stopping")
 
 
 class PluginCommand(click.Command):
@@ -13,9 +70,12 @@ class PluginCommand(click.Command):
         if (callback := self.callback) is None:
             return None
 
-        @wraps(callback)
-        def wrapper(*args: list[Any], **kwargs: dict[str, Any]) -> PluginFactory:
-            lifespan_manager = asynccontextmanager(partial(callback, *args, **kwargs))
+        def wrapper(*args: Any, **kwargs: Any) -> PluginFactory:
+            def lifespan_manager(*fargs: Any, **fkwargs: Any) -> _PluginLifespanContext:
+                return _PluginLifespanContext(
+                    callback(*args, *fargs, **kwargs, **fkwargs)
+                )
+
             lifespan_manager.__name__ = callback.__name__
             return lifespan_manager
 
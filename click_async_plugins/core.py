@@ -1,4 +1,5 @@
 import asyncio
+from collections.abc import Callable
 
 import click
 
@@ -8,6 +9,15 @@ from .group import plugin_group
 from .typedefs import PluginFactory
 from .util import CliContext, run_plugins
 
+try:
+    import uvloop
+
+    _loop_factory: Callable[[], asyncio.AbstractEventLoop] | None = (
+        uvloop.new_event_loop
+    )
+except ImportError:
+    _loop_factory = None
+
 
 @plugin_group
 @click.pass_context
@@ -17,4 +27,9 @@ def cli_core(ctx: click.Context) -> None:
 
 @cli_core.result_callback()
 def runner(plugin_factories: list[PluginFactory]) -> None:
-    asyncio.run(run_plugins(plugin_factories))
+    if _loop_factory is not None:
+        with asyncio.Runner(loop_factory=_loop_factory) as r:
+            r.run(run_plugins(plugin_factories))
+
+    else:
+        asyncio.run(run_plugins(plugin_factories))
@@ -46,29 +46,20 @@ def _name_for_coro(coro: Coroutine[Any, Any, Any] | None) -> str:
 
 def debug_info(clictx: CliContext) -> str:
     """Prints debugging information on tasks and CliContext"""
-    ret = "*** BEGIN DEBUG INFO: ***\n"
-    ret += "Tasks:\n"
-    for i, task in enumerate(asyncio.all_tasks(asyncio.get_event_loop()), 1):
-        coro = task.get_coro()
-        ret += (
-            f"  {i:02n}  {task.get_name():32s}  "
-            f"state={task._state.lower():8s}  "
-            f"coro={_name_for_coro(coro)}\n"
-        )
-    ret += "CliContext:\n"
-    maxlen = max([len(k) for k in clictx.__dict__.keys()])
-    for attr, value in clictx.__dict__.items():
-        ret += f"  {attr:>{maxlen}s} = {value!r}\n"
-    return ret + "*** END DEBUG INFO: ***"
-
-
-_LOGLEVELS = {
-    logging.DEBUG: "DEBUG",
-    logging.INFO: "INFO",
-    logging.WARN: "WARN",
-    logging.ERROR: "ERROR",
-    logging.CRITICAL: "CRITICAL",
-}
+    parts = ["*** BEGIN DEBUG INFO: ***", "Tasks:"]
+    parts.extend(
+        f"  {i:02n}  {task.get_name():32s}  "
+        f"state={task._state.lower():8s}  "
+        f"coro={_name_for_coro(task.get_coro())}"
+        for i, task in enumerate(asyncio.all_tasks(), 1)
+    )
+    parts.append("CliContext:")
+    maxlen = max(len(k) for k in clictx.__dict__.keys())
+    parts.extend(
+        f"  {attr:>{maxlen}s} = {value!r}" for attr, value in clictx.__dict__.items()
+    )
+    parts.append("*** END DEBUG INFO: ***")
+    return "\n".join(parts)
 
 
 def adjust_loglevel(_: CliContext, change: int) -> str | None:
@@ -79,7 +70,7 @@ def adjust_loglevel(_: CliContext, change: int) -> str | None:
         return None
 
     rootlogger.setLevel(newlevel)
-    return f"Log level now at {_LOGLEVELS[rootlogger.getEffectiveLevel()]}"
+    return f"Log level now at {logging.getLevelName(rootlogger.getEffectiveLevel())}"
 
 
 @dataclass
@@ -90,41 +81,69 @@ class KeyAndFunc[ContextT: CliContext]:
 
 type KeyCmdMapType[ContextT: CliContext] = dict[int, KeyAndFunc[ContextT]]
 
+_increase_loglevel = partial(adjust_loglevel, change=-10)
+_increase_loglevel.__doc__ = "Increase the logging level"
+_decrease_loglevel = partial(adjust_loglevel, change=10)
+_decrease_loglevel.__doc__ = "Decrease the logging level"
+
+_DEFAULT_KEY_MAP: KeyCmdMapType[Any] = {
+    0xA: KeyAndFunc(r"\n", echo_newline),
+    0xD: KeyAndFunc(r"\n", echo_newline),
+    0x1B: KeyAndFunc("<Esc>", terminal_block),
+    0x4: KeyAndFunc("^D", debug_info),
+    0x2B: KeyAndFunc("+", _increase_loglevel),
+    0x2D: KeyAndFunc("-", _decrease_loglevel),
+}
+
 
 def print_help[ContextT: CliContext](
     _: ContextT, key_to_cmd: KeyCmdMapType[ContextT]
 ) -> str:
-    ret = "Keys I know about for debugging:\n"
-    for keyfunc in key_to_cmd.values():
-        ret += f"  {keyfunc.key:5s} {keyfunc.func.__doc__}\n"
-    return ret + "  ?     Print this message"
+    parts = ["Keys I know about for debugging:"]
+    parts.extend(
+        f"  {keyfunc.key:5s} {keyfunc.func.__doc__}" for keyfunc in key_to_cmd.values()
+    )
+    parts.append("  ?     Print this message")
+    return "\n".join(parts)
 
 
 async def getch() -> AsyncGenerator[str]:
     try:
-        import fcntl
         import termios
         import tty
 
         fd = sys.stdin.fileno()
         termios_saved = termios.tcgetattr(fd)
-        fnctl_flags = fcntl.fcntl(sys.stdin, fcntl.F_GETFL)
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[bytes] = asyncio.Queue()
+
+        def on_readable() -> None:
+            if data := os.read(fd, 256):
+                queue.put_nowait(data)
+            else:
+                # EOF: stdin stays readable forever, so stop watching it
+                loop.remove_reader(fd)
 
         try:
             logger.debug("Configuring stdin for raw input")
             tty.setcbreak(fd)
-            fcntl.fcntl(sys.stdin, fcntl.F_SETFL, fnctl_flags | os.O_NONBLOCK)
+            loop.add_reader(fd, on_readable)
 
             while True:
-                yield sys.stdin.read(1)
+                for ch in (await queue.get()).decode(errors="replace"):
+                    yield ch
 
         except asyncio.CancelledError:
             pass
 
         finally:
             logger.debug("Restoring stdin")
+            loop.remove_reader(fd)
             termios.tcsetattr(fd, termios.TCSADRAIN, termios_saved)
-            fcntl.fcntl(sys.stdin, fcntl.F_SETFL, fnctl_flags)
+
+        # this branch is terminal: falling through to the msvcrt one after
+        # cancellation would raise NotImplementedError on every shutdown
+        return
 
     except ImportError:
         pass
@@ -149,24 +168,27 @@ async def _monitor_stdin[ContextT: CliContext](
     *,
     puts: Callable[[str], Any] = puts,
 ) -> None:
+    # byte-indexed dispatch table: a single indexed load per keypress
+    # instead of a dict lookup plus callable() check
+    dispatch: list[Callable[[ContextT], str | None] | None] = [None] * 256
+    for k, keyfunc in key_to_cmd.items():
+        if 0 <= k < 256 and callable(keyfunc.func):
+            dispatch[k] = keyfunc.func
+
+    debug = logger.debug
+
     try:
         async for ch in getch():
-            if len(ch) == 0:
-                await asyncio.sleep(0.1)
-                continue
-
             if (key := ord(ch)) == 0x3F:
                 puts(print_help(clictx, key_to_cmd))
 
-            elif (keyfunc := key_to_cmd.get(key)) is not None and callable(
-                keyfunc.func
-            ):
+            elif key < 256 and (fn := dispatch[key]) is not None:
                 # TODO: enable async functions
-                if (ret := keyfunc.func(clictx)) is not None:
+                if (ret := fn(clictx)) is not None:
                     puts(ret)
 
             else:
-                logger.debug(f"Ignoring character 0x{key:02x} on stdin")
+                debug("Ignoring character 0x%02x on stdin", key)
 
     except NotImplementedError:
         logger.warning("The 'debug' plugin does not work on this platform")
@@ -180,22 +202,7 @@ async def monitor_stdin_for_debug_commands[ContextT: CliContext](
     key_to_cmd: KeyCmdMapType[ContextT] | None = None,
     puts: Callable[[str], Any] = puts,
 ) -> PluginLifespan:
-    key_to_cmd = key_to_cmd or {}
-
-    increase_loglevel = partial(adjust_loglevel, change=-10)
-    increase_loglevel.__doc__ = "Increase the logging level"
-    decrease_loglevel = partial(adjust_loglevel, change=10)
-    decrease_loglevel.__doc__ = "Decrease the logging level"
-
-    map = {
-        0xA: KeyAndFunc(r"\n", echo_newline),
-        0xD: KeyAndFunc(r"\n", echo_newline),
-        0x1B: KeyAndFunc("<Esc>", terminal_block),
-        0x4: KeyAndFunc("^D", debug_info),
-        0x2B: KeyAndFunc("+", increase_loglevel),
-        0x2D: KeyAndFunc("-", decrease_loglevel),
-        **key_to_cmd,
-    }
+    map = _DEFAULT_KEY_MAP | key_to_cmd if key_to_cmd else _DEFAULT_KEY_MAP
     yield _monitor_stdin(clictx, map, puts=puts)
 
 
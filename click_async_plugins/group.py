@@ -1,5 +1,4 @@
 from collections.abc import Callable
-from typing import cast
 
 import click
 
@@ -9,7 +8,7 @@ from .typedefs import PluginLifespan
 
 class PluginGroup(click.Group):
     def plugin_command(self, fn: Callable[..., PluginLifespan]) -> PluginCommand:
-        return cast(PluginCommand, self.command(cls=PluginCommand)(fn))
+        return self.command(cls=PluginCommand)(fn)  # type: ignore[return-value]
 
 
 def plugin_group(fn: Callable[..., None]) -> PluginGroup:
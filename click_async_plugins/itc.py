@@ -1,28 +1,47 @@
 import asyncio
 import logging
 import time
-from collections import defaultdict
 from collections.abc import AsyncGenerator
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
+async def _wait(event: asyncio.Event, timeout: float | None) -> None:
+    if timeout is None:
+        await event.wait()
+        return
+
+    try:
+        async with asyncio.timeout(timeout):
+            await event.wait()
+    except TimeoutError:
+        logger.debug("Timeout after %ss", timeout)
+
+
 class ITC:
+    __slots__ = ("_waiters", "_versions", "_subscribers", "_objects")
+
     def __init__(self) -> None:
-        self._events: dict[str, list[asyncio.Event]] = defaultdict(list[asyncio.Event])
+        # one shared event per key, swapped out on every publication, plus a
+        # generation counter so subscribers can detect updates they slept
+        # through — publishing is O(1) no matter how many subscribers exist
+        self._waiters: dict[str, asyncio.Event] = {}
+        self._versions: dict[str, int] = {}
+        self._subscribers: dict[str, int] = {}
         self._objects: dict[str, Any] = {}
 
     def __repr__(self) -> str:
-        ret = f"{self.__class__.__name__}("
-        i = 0
-        for i, (key, obj) in enumerate(self._objects.items()):
-            ret = (
-                f"{ret}{'\n' if i == 0 else ''}       "
-                f"{key}={obj!r} "
-                f"({len(self._events[key])} listeners)\n"
-            )
-        return f"{ret}{'    ' if i > 0 else ''})"
+        if not self._objects:
+            return f"{self.__class__.__name__}()"
+
+        buf = [f"{self.__class__.__name__}(\n"]
+        buf.extend(
+            f"       {key}={obj!r} ({self._subscribers.get(key, 0)} listeners)\n"
+            for key, obj in self._objects.items()
+        )
+        buf.append("    )")
+        return "".join(buf)
 
     def set(self, key: str, obj: Any) -> None:
         self._objects[key] = obj
@@ -32,8 +51,12 @@ class ITC:
         return self._objects.get(key, default)
 
     def fire(self, key: str) -> None:
-        logger.debug(f"Notifying subscribers of update to '{key}'…")
-        for event in self._events.get(key) or []:
+        if not self.has_subscribers(key):
+            return
+
+        logger.debug("Notifying subscribers of update to '%s'…", key)
+        self._versions[key] = self._versions.get(key, 0) + 1
+        if (event := self._waiters.pop(key, None)) is not None:
             event.set()
 
     async def updates(
@@ -55,35 +78,41 @@ class ITC:
             logger.warning("timeout < at_most_every makes no sense, adjusting…")
             timeout = at_most_every
 
-        event = asyncio.Event()
-        self._events[key].append(event)
-
-        if yield_immediately:
-            yield self._objects.get(key, yield_for_no_value)
+        self._subscribers[key] = self._subscribers.get(key, 0) + 1
 
         try:
+            last_seen = self._versions.get(key, 0)
+
+            if yield_immediately:
+                yield self._objects.get(key, yield_for_no_value)
+
             timestamp = 0.0
             while True:
-                logger.debug(f"Waiting for update to '{key}'…")
-                try:
-                    async with asyncio.timeout(timeout):
-                        await event.wait()
-                except TimeoutError:
-                    logger.debug(f"Timeout after {timeout}s")
+                logger.debug("Waiting for update to '%s'…", key)
+                # only park if nothing was published since the last yield;
+                # the version counter catches updates we slept through
+                if self._versions.get(key, 0) == last_seen:
+                    if (event := self._waiters.get(key)) is None:
+                        event = self._waiters[key] = asyncio.Event()
+
+                    await _wait(event, timeout)
 
                 if (waitremain := timestamp + at_most_every - time.monotonic()) > 0:
-                    logger.debug(f"Too early, sleeping for {waitremain:.02f}s")
+                    logger.debug("Too early, sleeping for %.02fs", waitremain)
                     await asyncio.sleep(waitremain)
 
+                last_seen = self._versions.get(key, 0)
                 yield self._objects.get(key, yield_for_no_value)
-                event.clear()
                 timestamp = time.monotonic()
 
         finally:
-            self._events[key].remove(event)
+            if (remaining := self._subscribers.get(key, 1) - 1) > 0:
+                self._subscribers[key] = remaining
+            else:
+                self._subscribers.pop(key, None)
 
     def has_subscribers(self, key: str) -> bool:
-        return len(self._events.get(key, [])) > 0
+        return self._subscribers.get(key, 0) > 0
 
     def knows_about(self, key: str) -> bool:
         return key in self._objects
@@ -3,13 +3,12 @@ import logging
 from collections.abc import AsyncGenerator, Callable, Coroutine
 from contextlib import AsyncExitStack
 from dataclasses import dataclass
-from functools import partial, update_wrapper
 from typing import Any, Never
 
 import click
 
 from .itc import ITC
-from .typedefs import PluginFactory, PluginTask
+from .typedefs import Plugin, PluginFactory, PluginTask
 
 logger = logging.getLogger(__name__)
 
@@ -22,42 +21,46 @@ class CliContext:
 pass_clictx = click.make_pass_decorator(CliContext)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskWithName:
     task: PluginTask | None
     name: str
 
 
 async def sleep_forever(sleep: float = 1, *, forever: bool = True) -> Never | None:
-    while await asyncio.sleep(sleep, forever):
-        pass
+    if forever:
+        # a never-resolving Future parks without any timer heap entry;
+        # cancellation at teardown still propagates normally
+        await asyncio.get_running_loop().create_future()
+    else:
+        await asyncio.sleep(sleep)
     return None
 
 
+def _log_if_cancelled(task: asyncio.Task[Any]) -> None:
+    if task.cancelled():
+        logger.debug("Task for '%s' cancelled", task.get_name())
+
+
 def create_plugin_task[T](
     task: TaskWithName,
     *,
-    create_task_fn: Callable[..., asyncio.Task[T]] = asyncio.create_task,
+    create_task_fn: Callable[..., asyncio.Task[T]] | None = None,
 ) -> asyncio.Task[T]:
-    async def task_wrapper() -> None:
-        try:
-            if asyncio.iscoroutine(task.task):
-                logger.debug(f"Scheduling task for '{task.name}'")
-                await task.task
-
-            else:
-                logger.debug(f"Waiting until programme termination for '{task.name}'")
-                await sleep_forever(3600)
-
-        except asyncio.CancelledError:
-            logger.debug(f"Task for '{task.name}' cancelled")
+    if create_task_fn is None:
+        # asyncio.create_task would resolve the running loop all over again
+        create_task_fn = asyncio.get_running_loop().create_task
 
     if task.task is not None:
-        task_wrapper = update_wrapper(task_wrapper, task.task)  # type: ignore[arg-type]
+        logger.debug("Scheduling task for '%s'", task.name)
+        scheduled = create_task_fn(task.task, name=task.name)
+
     else:
-        task_wrapper = update_wrapper(task_wrapper, sleep_forever)
+        logger.debug("Waiting until programme termination for '%s'", task.name)
+        scheduled = create_task_fn(sleep_forever(), name=task.name)
 
-    return create_task_fn(task_wrapper(), name=task.name)
+    scheduled.add_done_callback(_log_if_cancelled)
+    return scheduled
 
 
 def _get_name(plugin_factory: PluginFactory) -> str:
@@ -77,25 +80,58 @@ async def setup_plugins(
     stack: AsyncExitStack,
     **kwargs: Any,
 ) -> list[TaskWithName]:
-    tasks: list[TaskWithName] = []
+    pending: list[tuple[str, Plugin]] = []
     for plugin_factory in plugin_factories:
         plugin_fn = plugin_factory(*args, **kwargs)
         name = _get_name(plugin_factory)
-        logger.debug(f"Setting up task for '{name}'")
-        task = await stack.enter_async_context(plugin_fn)
-        tasks.append(TaskWithName(task=task, name=name))
+        logger.debug("Setting up task for '%s'", name)
+        pending.append((name, plugin_fn))
+
+    # enter all lifespans concurrently so one plugin's setup I/O does not
+    # serialize behind another's; teardown must remain deterministic, so
+    # exits are registered afterwards in command order (unwound LIFO)
+    entries = [
+        asyncio.ensure_future(plugin_fn.__aenter__()) for _, plugin_fn in pending
+    ]
+    try:
+        results = await asyncio.gather(*entries, return_exceptions=True)
+
+    except asyncio.CancelledError:
+        # the gather was cancelled before anything was pushed on the stack;
+        # register the lifespans that did enter so they still get unwound
+        for (_, plugin_fn), entry in zip(pending, entries, strict=True):
+            if entry.done() and not entry.cancelled() and entry.exception() is None:
+                stack.push_async_exit(plugin_fn)
+        raise
+
+    tasks: list[TaskWithName] = []
+    error: BaseException | None = None
+    for (name, plugin_fn), result in zip(pending, results, strict=True):
+        if isinstance(result, BaseException):
+            error = error or result
+        else:
+            stack.push_async_exit(plugin_fn)
+            tasks.append(TaskWithName(task=result, name=name))
+
+    if error is not None:
+        raise error
 
     return tasks
 
 
 async def run_tasks(tasks: list[TaskWithName]) -> None:
+    if not tasks:
+        return
+
     try:
         async with asyncio.TaskGroup() as tg:
-            plugin_task = partial(create_plugin_task, create_task_fn=tg.create_task)
             for task in tasks:
-                plugin_task(task)
+                create_plugin_task(task, create_task_fn=tg.create_task)
 
-    except* asyncio.CancelledError:
+    except asyncio.CancelledError:
+        # plugin tasks end cancelled, but TaskGroup ignores cancelled
+        # children and re-raises the outer CancelledError unwrapped, so a
+        # plain except suffices — no ExceptionGroup is ever built here
         pass
 
     finally:
@@ -105,6 +141,13 @@ async def run_tasks(tasks: list[TaskWithName]) -> None:
 async def run_plugins(
     plugin_factories: list[PluginFactory], *args: Any, **kwargs: Any
 ) -> None:
+    if not plugin_factories:
+        return
+
+    # Let plugin coroutines run synchronously up to their first real
+    # suspension instead of paying one loop iteration each just to start
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     async with AsyncExitStack() as stack:
         tasks = await setup_plugins(plugin_factories, *args, stack=stack, **kwargs)
         await run_tasks(tasks)
@@ -34,11 +34,24 @@ async def countdown(
     clictx: CliContext, start: int = 3, sleep: float = 1
 ) -> PluginLifespan:
     async def counter(start: int, sleep: float) -> None:
-        cur = start
-        while cur > 0:
-            logger.info(f"Counting down… {cur}")
+        loop = asyncio.get_running_loop()
+        done: asyncio.Future[None] = loop.create_future()
+
+        def emit(cur: int) -> None:
+            logger.info("Counting down… %s", cur)
             clictx.itc.set("countdown", cur)
-            cur = await asyncio.sleep(sleep, cur - 1)
+
+        # pre-schedule every tick at its absolute time instead of paying a
+        # coroutine wakeup per iteration
+        t0 = loop.time()
+        handles = [loop.call_at(t0 + i * sleep, emit, start - i) for i in range(start)]
+        handles.append(loop.call_at(t0 + start * sleep, done.set_result, None))
+
+        try:
+            await done
+        finally:
+            for handle in handles:
+                handle.cancel()
 
         logger.info("Finished counting down")
 
@@ -58,7 +71,7 @@ async def countdown(
 async def echo(clictx: CliContext, immediately: bool) -> PluginLifespan:
     async def reactor() -> None:
         async for cur in clictx.itc.updates("countdown", yield_immediately=immediately):
-            logger.info(f"Countdown currently at {cur}")
+            logger.info("Countdown currently at %s", cur)
 
     yield reactor()
 